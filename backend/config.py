@@ -22,5 +22,14 @@ class Settings:
     # Data Storage
     DATA_DIRECTORY: str = os.getenv("DATA_DIRECTORY", "data")
     USER_DATA_FILE: str = os.path.join(DATA_DIRECTORY, "user_data.json")
+    # Conversation Session Configuration
+    SESSION_MAX_TURNS: int = int(os.getenv("SESSION_MAX_TURNS", "12"))  # messages kept verbatim
+    SESSION_MAX_TURN_CHARS: int = int(os.getenv("SESSION_MAX_TURN_CHARS", "4000"))
+    SESSION_TOKEN_THRESHOLD: int = int(os.getenv("SESSION_TOKEN_THRESHOLD", "1500"))
+    SESSION_SUMMARY_MAX_CHARS: int = int(os.getenv("SESSION_SUMMARY_MAX_CHARS", "2000"))
+    SESSION_SUMMARY_SNIPPET_CHARS: int = int(os.getenv("SESSION_SUMMARY_SNIPPET_CHARS", "200"))
+    SESSION_MAX_SESSIONS: int = int(os.getenv("SESSION_MAX_SESSIONS", "1000"))
+    SESSION_IDLE_TIMEOUT: int = int(os.getenv("SESSION_IDLE_TIMEOUT", "3600"))  # seconds
+    SESSION_MAX_MEMORY_BYTES: int = int(os.getenv("SESSION_MAX_MEMORY_BYTES", "52428800"))  # 50MB
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""Offline bulk ingestion of documents into Insightmate.
+
+Walks a directory (or a .zip/.tar archive), extracts text from every supported
+file in parallel using the FileService extractors, and stores the results in
+batches. Files that are already stored are skipped, so an interrupted run can
+simply be started again.
+
+Stop the API server while ingesting: both write the same data file, and
+changes made by one can be overwritten by the other.
+
+Usage:
+    python ingest.py path/to/resumes --workers 8 --batch-size 100
+"""
+import os
+import sys
+import time
+import signal
+import asyncio
+import argparse
+import tarfile
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from services.file_service import FileService
+from services.data_service import DataService
+
+ZIP_SUFFIXES = (".zip",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+# Metadata folders that archive tools and version control leave behind
+SKIPPED_DIRECTORIES = {"__MACOSX"}
+CRASH_ERROR = "Worker process crashed while extracting this file"
+
+# Set once per worker process by _init_worker
+_file_service: Optional[FileService] = None
+
+
+def _init_worker():
+    global _file_service
+    # Ctrl-C is handled by the parent, which cancels pending work itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _file_service = FileService()
+
+
+def _extract(key: str, file_path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Extract text from one file inside a worker; returns (key, content, error)"""
+    try:
+        file_size = os.path.getsize(file_path)
+        if file_size > _file_service.max_file_size:
+            return key, None, f"File too large: {file_size} bytes"
+        content = asyncio.run(_file_service.extract_text(file_path))
+        return key, content, None
+    except Exception as e:
+        return key, None, str(e)
+
+
+def _extract_isolated(key: str, file_path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Extract one file in its own worker so a crash only affects that file"""
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker) as executor:
+        try:
+            return executor.submit(_extract, key, file_path).result()
+        except BrokenProcessPool:
+            return key, None, CRASH_ERROR
+
+
+def _archive_type(path: str) -> Optional[str]:
+    """Return "zip" or "tar" for a supported archive, otherwise None"""
+    name = path.lower()
+    if name.endswith(ZIP_SUFFIXES) and zipfile.is_zipfile(path):
+        return "zip"
+    if name.endswith(TAR_SUFFIXES) and tarfile.is_tarfile(path):
+        return "tar"
+    return None
+
+
+def _unpack_archive(archive_path: str, target_dir: str):
+    """Extract a .zip or .tar(.gz/.bz2/.xz) archive into target_dir"""
+    archive_type = _archive_type(archive_path)
+    if archive_type == "zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(target_dir)
+    elif archive_type == "tar":
+        with tarfile.open(archive_path) as archive:
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(target_dir, filter="data")
+            else:
+                # Older Pythons have no extraction filters; vet members ourselves
+                _check_tar_members(archive)
+                archive.extractall(target_dir)
+    else:
+        raise ValueError(f"Unsupported archive format: {archive_path}")
+
+
+def _check_tar_members(archive: tarfile.TarFile):
+    """Reject tar members that could write outside the extraction directory"""
+    for member in archive.getmembers():
+        path = PurePosixPath(member.name)
+        if path.is_absolute() or ".." in path.parts:
+            raise ValueError(f"Unsafe path in archive: {member.name}")
+        if member.issym() or member.islnk():
+            raise ValueError(f"Links are not allowed in archives: {member.name}")
+        if not (member.isfile() or member.isdir()):
+            raise ValueError(f"Unsupported member type in archive: {member.name}")
+
+
+def _walk_files(root_dir: str, file_service: FileService) -> Iterator[Tuple[str, str]]:
+    """Yield (key, path) for every supported file under root_dir"""
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        # Skip hidden entries (.git, .DS_Store, AppleDouble "._" files) and __MACOSX
+        dirnames[:] = sorted(
+            name for name in dirnames
+            if not name.startswith(".") and name not in SKIPPED_DIRECTORIES
+        )
+        for filename in sorted(filenames):
+            if filename.startswith("."):
+                continue
+            if Path(filename).suffix.lower() not in file_service.allowed_extensions:
+                continue
+            file_path = os.path.join(dirpath, filename)
+            # Relative paths keep same-named files in different folders apart
+            key = Path(os.path.relpath(file_path, root_dir)).as_posix()
+            yield key, file_path
+
+
+def _report(done: int, total: int, errors: int, started_at: float):
+    elapsed = time.monotonic() - started_at
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"[{done}/{total}] {rate:.1f} files/s, {errors} errors, {elapsed:.1f}s elapsed")
+
+
+def ingest(source: str, workers: Optional[int] = None, batch_size: int = 50,
+           force: bool = False, progress_interval: float = 2.0) -> dict:
+    """Ingest all supported files under a directory or archive"""
+    file_service = FileService()
+    data_service = DataService()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if os.path.isdir(source):
+            root_dir = source
+        else:
+            _unpack_archive(source, temp_dir)
+            root_dir = temp_dir
+        # Skip files stored by a previous run unless asked to redo them
+        existing = set() if force else set(data_service.get_files())
+        pending: List[Tuple[str, str]] = []
+        skipped = 0
+        for key, file_path in _walk_files(root_dir, file_service):
+            if key in existing:
+                skipped += 1
+            else:
+                pending.append((key, file_path))
+        total = len(pending)
+        print(f"Found {total + skipped} files, {skipped} already ingested, {total} to process")
+
+        started_at = last_report = time.monotonic()
+        batch: Dict[str, str] = {}
+        errors = []
+        done = 0
+        interrupted = False
+        queue = deque(pending)
+        # Only a few files are handed to the pool at once, so after a worker
+        # crash the files that could have caused it are known
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+
+        def record(key: str, content: Optional[str], error: Optional[str]):
+            nonlocal done
+            done += 1
+            if error:
+                errors.append((key, error))
+                print(f"Error: {key}: {error}", file=sys.stderr)
+            else:
+                batch[key] = content
+
+        def settle(future: Future, key: str) -> bool:
+            # Record a finished future; returns False if its worker crashed
+            try:
+                record(*future.result())
+            except BrokenProcessPool:
+                return False
+            except Exception as e:
+                record(key, None, str(e))
+            return True
+
+        def flush():
+            nonlocal batch
+            if batch:
+                data_service.add_files_data(batch, source="ingest")
+                batch = {}
+
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < max_in_flight:
+                    key, file_path = queue.popleft()
+                    in_flight[executor.submit(_extract, key, file_path)] = (key, file_path)
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                suspects = []
+                for future in finished:
+                    key, file_path = in_flight.pop(future)
+                    if not settle(future, key):
+                        suspects.append((key, file_path))
+                if suspects:
+                    # A crashed worker breaks the whole pool; everything still in
+                    # flight failed with it, so retry those files one at a time
+                    for future, (key, file_path) in list(in_flight.items()):
+                        if not (future.done() and settle(future, key)):
+                            suspects.append((key, file_path))
+                    in_flight.clear()
+                    executor.shutdown(wait=True)
+                    print(f"Worker crashed, retrying {len(suspects)} files one at a time",
+                          file=sys.stderr)
+                    for key, file_path in suspects:
+                        record(*_extract_isolated(key, file_path))
+                    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+                if len(batch) >= batch_size:
+                    flush()
+                # The final line is printed once after the loop
+                if done < total and time.monotonic() - last_report >= progress_interval:
+                    _report(done, total, len(errors), started_at)
+                    last_report = time.monotonic()
+        except KeyboardInterrupt:
+            interrupted = True
+            print("Interrupted, saving completed files...", file=sys.stderr)
+        finally:
+            # Drop queued files; only the ones already being extracted finish
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Keep files that finished while shutting down, so a rerun resumes
+            for future, (key, file_path) in in_flight.items():
+                if future.done() and not future.cancelled():
+                    settle(future, key)
+            flush()
+        _report(done, total, len(errors), started_at)
+
+    return {
+        "processed": done - len(errors),
+        "skipped": skipped,
+        "interrupted": interrupted,
+        "errors": [{"filename": key, "error": error} for key, error in errors]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-ingest a directory or archive of documents")
+    parser.add_argument("source", help="Directory or .zip/.tar archive to ingest")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Number of files stored per write (default: 50)")
+    parser.add_argument("--progress-interval", type=float, default=2.0,
+                        help="Seconds between progress reports (default: 2)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-ingest files that are already stored")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        parser.error(f"Source not found: {args.source}")
+    if not os.path.isdir(args.source) and _archive_type(args.source) is None:
+        parser.error(f"Source must be a directory or a .zip/.tar archive: {args.source}")
+    try:
+        result = ingest(args.source, workers=args.workers,
+                        batch_size=max(1, args.batch_size), force=args.force,
+                        progress_interval=args.progress_interval)
+    except (ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        # Raised while unpacking an unsafe or corrupt archive
+        parser.error(str(e))
+    print(f"Done: {result['processed']} ingested, {result['skipped']} skipped, "
+          f"{len(result['errors'])} errors")
+    if result["interrupted"]:
+        sys.exit(130)
+    sys.exit(1 if result["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
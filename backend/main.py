@@ -11,6 +11,7 @@ from datetime import datetime
 from services.ai_service import AIService
 from services.file_service import FileService
 from services.data_service import DataService
+from services.session_service import SessionService
 from config import settings
 
 app = FastAPI(
@@ -31,16 +32,19 @@ app.add_middleware(
 ai_service = AIService()
 file_service = FileService()
 data_service = DataService()
+session_service = SessionService()
 
 # Pydantic models
 class ChatMessage(BaseModel):
     message: str
     mode: str = "general"  # "general" or "personalized"
+    session_id: Optional[str] = None  # server-issued; omit to start a new conversation
 
 class ChatResponse(BaseModel):
     response: str
     mode: str
     timestamp: str
+    session_id: str
 
 class PortfolioLink(BaseModel):
     url: str
@@ -59,18 +63,25 @@ async def root():
 async def chat(chat_message: ChatMessage):
     """Handle chat messages for both general and personalized modes"""
     try:
+        # Continue an existing conversation or start a new one
+        session_id = session_service.resolve_session_id(chat_message.session_id)
+        history = session_service.get_history(session_id)
         if chat_message.mode == "general":
-            response = await ai_service.general_chat(chat_message.message)
+            response, is_fallback = await ai_service.general_chat(chat_message.message, history)
         else:
             # Get user data for personalized response
             user_data = data_service.get_user_data()
-            response = await ai_service.personalized_chat(
-                chat_message.message, user_data
+            response, is_fallback = await ai_service.personalized_chat(
+                chat_message.message, user_data, history
             )
+        # Canned fallback text is not part of the conversation
+        if not is_fallback:
+            session_service.add_turn(session_id, chat_message.message, response)
         return ChatResponse(
             response=response,
             mode=chat_message.mode,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            session_id=session_id
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -118,12 +129,15 @@ async def get_user_data():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.delete("/api/files/{filename}")
+@app.delete("/api/files/{filename:path}")
 async def delete_file(filename: str):
     """Delete uploaded file"""
     try:
+        file_entry = data_service.get_files().get(filename, {})
         data_service.delete_file(filename)
-        file_service.delete_file(filename)
+        # Bulk-ingested entries have no copy in the uploads directory
+        if file_entry.get("source") != "ingest":
+            file_service.delete_file(filename)
         return {"message": f"File {filename} deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -137,6 +151,15 @@ async def delete_portfolio_link(link_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.delete("/api/sessions/{session_id}")
+async def delete_session(session_id: str):
+    """Clear conversation history for a session"""
+    try:
+        session_service.clear_session(session_id)
+        return {"message": "Session cleared successfully"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -146,7 +169,8 @@ async def health_check():
         "services": {
             "ai_service": "active",
             "file_service": "active",
-            "data_service": "active"
+            "data_service": "active",
+            "session_service": session_service.get_stats()
         }
     }
 
@@ -1,6 +1,6 @@
 import openai
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import sys
 
@@ -33,25 +33,30 @@ class AIService:
             "Be encouraging and provide actionable advice."
         )
 
-    async def general_chat(self, message: str) -> str:
-        """Handle general AI chat without personalization"""
+    async def general_chat(self, message: str, history: Optional[Dict[str, Any]] = None) -> Tuple[str, bool]:
+        """Handle general AI chat without personalization
+        Returns the reply and whether it is a fallback response
+        """
         try:
             response = self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": self.general_system_prompt},
+                    *self._build_history_messages(history),
                     {"role": "user", "content": message}
                 ],
                 max_tokens=1000,
                 temperature=0.7
             )
-            return response.choices[0].message.content
+            return response.choices[0].message.content, False
         except Exception as e:
             # Fallback response if OpenAI API is not available
-            return self._fallback_response(message, "general")
+            return self._fallback_response(message, "general"), True
 
-    async def personalized_chat(self, message: str, user_data: Dict[str, Any]) -> str:
-        """Handle personalized chat using user's data"""
+    async def personalized_chat(self, message: str, user_data: Dict[str, Any], history: Optional[Dict[str, Any]] = None) -> Tuple[str, bool]:
+        """Handle personalized chat using user's data
+        Returns the reply and whether it is a fallback response
+        """
         try:
             # Build context from user data
             context = self._build_user_context(user_data)
@@ -61,15 +66,30 @@ class AIService:
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": personalized_prompt},
+                    *self._build_history_messages(history),
                     {"role": "user", "content": message}
                 ],
                 max_tokens=1000,
                 temperature=0.7
             )
-            return response.choices[0].message.content
+            return response.choices[0].message.content, False
         except Exception as e:
             # Fallback response if OpenAI API is not available
-            return self._fallback_response(message, "personalized", user_data)
+            return self._fallback_response(message, "personalized", user_data), True
+
+    def _build_history_messages(self, history: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """Build chat messages from a session's rolling summary and recent turns"""
+        if not history:
+            return []
+        messages = []
+        if history.get("summary"):
+            messages.append({
+                "role": "system",
+                "content": f"Summary of earlier conversation:\n{history['summary']}"
+            })
+        for turn in history.get("turns", []):
+            messages.append({"role": turn["role"], "content": turn["content"]})
+        return messages
 
     def _build_user_context(self, user_data: Dict[str, Any]) -> str:
         """Build context string from user data"""
@@ -1,6 +1,8 @@
 import os
 import json
 import uuid
+import stat
+import tempfile
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import sys
@@ -8,6 +10,10 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import settings
 
+# Read the process umask once at import time; os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 class DataService:
     def __init__(self):
         # Initialize data storage paths
@@ -43,10 +49,27 @@ class DataService:
             return self.get_user_data()
 
     def _save_user_data(self, data: Dict[str, Any]):
-        # Save user data to file
+        # Save user data to file; write to a uniquely named temp file and swap it
+        # in so an interrupted save never leaves a half-written data file behind
         data["updated_at"] = datetime.now().isoformat()
-        with open(self.user_data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        data_dir = os.path.dirname(os.path.abspath(self.user_data_file))
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=data_dir, suffix='.tmp', delete=False
+        ) as f:
+            tmp_file = f.name
+            try:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            except Exception:
+                f.close()
+                os.remove(tmp_file)
+                raise
+        # Temp files are created 0600; keep the data file's existing permissions
+        if os.path.exists(self.user_data_file):
+            mode = stat.S_IMODE(os.stat(self.user_data_file).st_mode)
+        else:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, self.user_data_file)
 
     def add_portfolio_link(self, link_data: Dict[str, Any], processed_content: str = "") -> str:
         # Add a portfolio link with processed content
@@ -77,6 +100,26 @@ class DataService:
         user_data["files"][filename] = file_entry
         self._save_user_data(user_data)
 
+    def add_files_data(self, files: Dict[str, str], source: Optional[str] = None):
+        # Add processed data for many files with a single read and write;
+        # source records where entries came from (e.g. "ingest")
+        if not files:
+            return
+        user_data = self.get_user_data()
+        if "files" not in user_data or not isinstance(user_data["files"], dict):
+            user_data["files"] = {}
+        uploaded_at = datetime.now().isoformat()
+        for filename, processed_content in files.items():
+            user_data["files"][filename] = {
+                "filename": filename,
+                "content": processed_content,
+                "file_type": self._get_file_type(filename),
+                "uploaded_at": uploaded_at
+            }
+            if source:
+                user_data["files"][filename]["source"] = source
+        self._save_user_data(user_data)
+
     def delete_file(self, filename: str):
         # Delete file data
         user_data = self.get_user_data()
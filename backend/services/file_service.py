@@ -46,20 +46,29 @@ class FileService:
     async def process_file(self, file_path: str) -> str:
         """Process uploaded file and extract text content"""
         file_extension = Path(file_path).suffix.lower()
+        if file_extension not in self.allowed_extensions:
+            return f"File type {file_extension} not supported for content extraction."
         try:
-            if file_extension == '.pdf':
-                return await self.process_pdf(file_path)
-            elif file_extension == '.txt':
-                return await self.process_text(file_path)
-            elif file_extension in ['.doc', '.docx']:
-                return await self.process_document(file_path)
-            elif file_extension in ['.jpg', '.jpeg', '.png', '.gif']:
-                return await self.process_image(file_path)
-            else:
-                return f"File type {file_extension} not supported for content extraction."
+            return await self.extract_text(file_path)
         except Exception as e:
             return f"Error processing file: {str(e)}"
 
+    async def extract_text(self, file_path: str) -> str:
+        """Extract text content from a file, raising on failure
+        Unlike process_file, errors propagate so callers can tell them apart from content
+        """
+        file_extension = Path(file_path).suffix.lower()
+        if file_extension == '.pdf':
+            return await self._extract_pdf(file_path)
+        elif file_extension == '.txt':
+            return await self._extract_text_file(file_path)
+        elif file_extension in ['.doc', '.docx']:
+            return await self._extract_document(file_path)
+        elif file_extension in ['.jpg', '.jpeg', '.png', '.gif']:
+            return await self._extract_image(file_path)
+        else:
+            raise ValueError(f"File type {file_extension} not supported for content extraction.")
+
     async def process_url(self, url: str) -> str:
         """Process URL and extract content"""
         try:
@@ -91,9 +100,13 @@ class FileService:
     def delete_file(self, filename: str) -> bool:
         """Delete file from uploads directory"""
         try:
+            prefix = filename.split('.')[0]
+            # An empty prefix (e.g. ".hidden") would match any upload
+            if not prefix:
+                return False
             # Find file in uploads directory
             for file in os.listdir(self.upload_dir):
-                if file.startswith(filename.split('.')[0]):
+                if file.startswith(prefix):
                     file_path = os.path.join(self.upload_dir, file)
                     os.remove(file_path)
                     return True
@@ -104,36 +117,14 @@ class FileService:
     async def process_pdf(self, file_path: str) -> str:
         """Extract text from PDF using PyMuPDF"""
         try:
-            doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            # Fallback to pdfplumber if PyMuPDF fails
-            if not text.strip():
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            return text.strip() if text.strip() else "No text content found in PDF."
+            return await self._extract_pdf(file_path)
         except Exception as e:
             return f"Error processing PDF: {str(e)}"
 
     async def process_text(self, file_path: str) -> str:
         """Process plain text file"""
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-            return content
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                async with aiofiles.open(file_path, 'r', encoding='latin-1') as f:
-                    content = await f.read()
-                return content
-            except Exception as e:
-                return f"Error reading text file: {str(e)}"
+            return await self._extract_text_file(file_path)
         except Exception as e:
             return f"Error processing text file: {str(e)}"
 
@@ -142,9 +133,7 @@ class FileService:
         Note: This is a basic implementation. For better results, consider using python-docx for .docx files
         """
         try:
-            # This is a placeholder implementation
-            # In a real application, you would use libraries like python-docx
-            return f"Document processing not fully implemented for: {file_path}"
+            return await self._extract_document(file_path)
         except Exception as e:
             return f"Error processing document: {str(e)}"
 
@@ -153,13 +142,45 @@ class FileService:
         Note: This would require OCR capabilities for text extraction
         """
         try:
-            # This is a placeholder implementation
-            # In a real application, you would use OCR libraries like pytesseract
-            file_size = os.path.getsize(file_path)
-            return f"Image file processed. Size: {file_size} bytes. OCR not implemented yet."
+            return await self._extract_image(file_path)
         except Exception as e:
             return f"Error processing image: {str(e)}"
 
+    async def _extract_pdf(self, file_path: str) -> str:
+        doc = fitz.open(file_path)
+        text = ""
+        for page in doc:
+            text += page.get_text()
+        doc.close()
+        # Fallback to pdfplumber if PyMuPDF fails
+        if not text.strip():
+            with pdfplumber.open(file_path) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+        return text.strip() if text.strip() else "No text content found in PDF."
+
+    async def _extract_text_file(self, file_path: str) -> str:
+        try:
+            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                return await f.read()
+        except UnicodeDecodeError:
+            # Try with different encoding
+            async with aiofiles.open(file_path, 'r', encoding='latin-1') as f:
+                return await f.read()
+
+    async def _extract_document(self, file_path: str) -> str:
+        # This is a placeholder implementation
+        # In a real application, you would use libraries like python-docx
+        return f"Document processing not fully implemented for: {file_path}"
+
+    async def _extract_image(self, file_path: str) -> str:
+        # This is a placeholder implementation
+        # In a real application, you would use OCR libraries like pytesseract
+        file_size = os.path.getsize(file_path)
+        return f"Image file processed. Size: {file_size} bytes. OCR not implemented yet."
+
     def _is_allowed_file(self, filename: str) -> bool:
         """Check if file type is allowed"""
         if not filename:
@@ -0,0 +1,187 @@
+import os
+import time
+import uuid
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import settings
+
+
+class ConversationSession:
+    """Conversation state for a single session.
+
+    Recent turns live in a fixed-capacity ring buffer; turns that fall out of
+    the buffer (or push it over the token threshold) are folded into a rolling
+    summary whose length is capped, so the prompt built from a session stays
+    bounded no matter how long the conversation runs.
+    """
+
+    __slots__ = ("session_id", "turns", "summary", "last_access")
+
+    def __init__(self, session_id: str, max_turns: int):
+        self.session_id = session_id
+        self.turns = deque(maxlen=max_turns)
+        self.summary = ""
+        self.last_access = time.monotonic()
+
+    def token_count(self) -> int:
+        """Estimate tokens held by the session (summary plus buffered turns)"""
+        total = _estimate_tokens(self.summary)
+        for turn in self.turns:
+            total += _estimate_tokens(turn["content"])
+        return total
+
+    def size_bytes(self) -> int:
+        """UTF-8 size of the session's key and text, used for the global hard cap"""
+        total = len(self.session_id.encode("utf-8")) + len(self.summary.encode("utf-8"))
+        for turn in self.turns:
+            total += len(turn["content"].encode("utf-8"))
+        return total
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough heuristic (~4 characters per token); good enough for budgeting
+    return (len(text) + 3) // 4
+
+
+class SessionService:
+    def __init__(self):
+        # Limits for each session and for the store as a whole
+        self.max_turns = max(2, settings.SESSION_MAX_TURNS)
+        self.max_turn_chars = settings.SESSION_MAX_TURN_CHARS
+        self.token_threshold = settings.SESSION_TOKEN_THRESHOLD
+        self.summary_max_chars = settings.SESSION_SUMMARY_MAX_CHARS
+        self.summary_snippet_chars = settings.SESSION_SUMMARY_SNIPPET_CHARS
+        self.max_sessions = settings.SESSION_MAX_SESSIONS
+        self.idle_timeout = settings.SESSION_IDLE_TIMEOUT
+        self.max_memory_bytes = settings.SESSION_MAX_MEMORY_BYTES
+        # Sessions ordered from least to most recently used
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_history(self, session_id: str) -> Dict[str, Any]:
+        """Get the rolling summary and recent turns for a session"""
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is None:
+                return {"summary": "", "turns": []}
+            self._touch(session)
+            return {
+                "summary": session.summary,
+                "turns": [dict(turn) for turn in session.turns]
+            }
+
+    def add_turn(self, session_id: str, user_message: str, assistant_message: str):
+        """Record a user/assistant exchange and compact the session if needed"""
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = ConversationSession(session_id, self.max_turns)
+                self._sessions[session_id] = session
+                # Nothing of a new session is counted yet, including its key
+                before = 0
+            else:
+                before = session.size_bytes()
+            self._touch(session)
+            self._append(session, "user", user_message)
+            self._append(session, "assistant", assistant_message)
+            self._compact(session)
+            self._total_bytes += session.size_bytes() - before
+            self._enforce_limits(keep=session_id)
+
+    def clear_session(self, session_id: str) -> bool:
+        """Drop all history for a session"""
+        # Match the canonical key used when the session was created
+        try:
+            session_id = str(uuid.UUID(session_id))
+        except ValueError:
+            return False
+        with self._lock:
+            return self._remove(session_id)
+
+    def resolve_session_id(self, session_id: Optional[str] = None) -> str:
+        """Return the canonical form of a server-issued session ID, or a new one"""
+        if session_id:
+            try:
+                return str(uuid.UUID(session_id))
+            except ValueError:
+                pass
+        return str(uuid.uuid4())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about in-memory sessions"""
+        with self._lock:
+            return {
+                "active_sessions": len(self._sessions),
+                "total_size_bytes": self._total_bytes,
+                "max_sessions": self.max_sessions,
+                "max_memory_bytes": self.max_memory_bytes
+            }
+
+    def _append(self, session: ConversationSession, role: str, content: str):
+        # Bound individual turns so one huge message cannot blow the budget
+        if len(content) > self.max_turn_chars:
+            content = content[:self.max_turn_chars] + "... [truncated]"
+        # The deque would silently drop its oldest turn; fold it first
+        if len(session.turns) == session.turns.maxlen:
+            self._fold(session, session.turns.popleft())
+        session.turns.append({"role": role, "content": content})
+
+    def _compact(self, session: ConversationSession):
+        # Fold oldest turns into the summary until under the token threshold,
+        # always keeping the latest exchange verbatim
+        while session.token_count() > self.token_threshold and len(session.turns) > 2:
+            self._fold(session, session.turns.popleft())
+
+    def _fold(self, session: ConversationSession, turn: Dict[str, str]):
+        # Append a short snippet of the turn to the rolling summary
+        snippet = " ".join(turn["content"].split())
+        if len(snippet) > self.summary_snippet_chars:
+            snippet = snippet[:self.summary_snippet_chars] + "..."
+        speaker = "User" if turn["role"] == "user" else "Assistant"
+        line = f"{speaker}: {snippet}"
+        summary = f"{session.summary}\n{line}" if session.summary else line
+        # Keep only the most recent part of the summary once it is full
+        if len(summary) > self.summary_max_chars:
+            summary = summary[-self.summary_max_chars:]
+            newline = summary.find("\n")
+            if newline != -1:
+                summary = summary[newline + 1:]
+        session.summary = summary
+
+    def _touch(self, session: ConversationSession):
+        session.last_access = time.monotonic()
+        self._sessions.move_to_end(session.session_id)
+
+    def _remove(self, session_id: str) -> bool:
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._total_bytes -= session.size_bytes()
+        return True
+
+    def _evict_idle(self):
+        # Least recently used sessions come first, so stop at the first fresh one
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_access >= cutoff:
+                break
+            self._remove(session_id)
+
+    def _enforce_limits(self, keep: Optional[str] = None):
+        # Evict least recently used sessions until within the session and memory caps
+        while self._sessions and (
+            len(self._sessions) > self.max_sessions
+            or self._total_bytes > self.max_memory_bytes
+        ):
+            session_id = next(iter(self._sessions))
+            if session_id == keep:
+                break
+            self._remove(session_id)
@@ -0,0 +1,37 @@
+import os
+import sys
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.session_service import SessionService
+
+
+def _tracked_size(service: SessionService) -> int:
+    return sum(session.size_bytes() for session in service._sessions.values())
+
+
+def test_total_bytes_matches_sessions_after_adds_and_evictions():
+    service = SessionService()
+    service.max_sessions = 3
+    session_ids = [str(uuid.uuid4()) for _ in range(6)]
+    for session_id in session_ids:
+        for i in range(20):
+            service.add_turn(session_id, f"question {i} héllo ✓ " * 10, f"answer {i} " * 30)
+            assert service._total_bytes == _tracked_size(service)
+    assert len(service._sessions) == 3
+
+    service.clear_session(session_ids[-1])
+    assert service._total_bytes == _tracked_size(service)
+
+    for session_id in session_ids:
+        service.clear_session(session_id)
+    assert service._total_bytes == 0
+
+
+def test_clear_session_accepts_non_canonical_id():
+    service = SessionService()
+    session_id = service.resolve_session_id(None)
+    service.add_turn(session_id, "hi", "hello")
+    assert service.clear_session("{" + session_id.upper() + "}")
+    assert service.get_stats()["active_sessions"] == 0
+    assert not service.clear_session("not-a-session")
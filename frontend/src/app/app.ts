@@ -75,6 +75,8 @@ export class App implements OnInit, OnDestroy, AfterViewChecked {
 
   switchMode(mode: 'general' | 'personalized') {
     this.currentMode = mode;
+    // Each mode keeps its own server-side session, so switching back
+    // resumes that mode's conversation
     // Optionally clear messages when switching modes
     // this.chatService.clearMessages();
   }
@@ -123,6 +125,12 @@ export class App implements OnInit, OnDestroy, AfterViewChecked {
     this.startChat();
   }
 
+  // Start a fresh conversation, dropping its history on the server too
+  newChat() {
+    this.chatService.clearMessages();
+    this.navigateToChat();
+  }
+
   sendMessage() {
     if (this.messageText.trim()) {
       const userMessage = this.messageText.trim();
@@ -133,13 +141,16 @@ export class App implements OnInit, OnDestroy, AfterViewChecked {
       // Set loading state
       this.chatService.setLoading(true);
       // Send to appropriate endpoint
+      const mode = this.currentMode;
+      const sessionId = this.chatService.getSessionId(mode);
       const apiCall = this.currentMode === 'general'
-        ? this.apiService.chatGeneral(userMessage)
-        : this.apiService.chatPersonalized(userMessage);
+        ? this.apiService.chatGeneral(userMessage, sessionId)
+        : this.apiService.chatPersonalized(userMessage, sessionId);
       apiCall
         .pipe(takeUntil(this.destroy$))
         .subscribe({
           next: (response) => {
+            this.chatService.setSessionId(mode, response.session_id);
             this.chatService.addAiMessage(response.response, this.currentMode);
             this.chatService.setLoading(false);
           },
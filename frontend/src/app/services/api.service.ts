@@ -5,11 +5,13 @@ import { Observable } from 'rxjs';
 export interface ChatRequest {
   message: string;
   mode: 'general' | 'personalized';
+  session_id?: string;
 }
 
 export interface ChatResponse {
   response: string;
   mode: string;
+  session_id: string;
 }
 
 export interface UploadResponse {
@@ -31,16 +33,20 @@ export class ApiService {
   constructor(private http: HttpClient) {}
 
   // Chat endpoints
-  chatGeneral(message: string): Observable<ChatResponse> {
-    const payload: ChatRequest = { message, mode: 'general' };
+  chatGeneral(message: string, sessionId?: string): Observable<ChatResponse> {
+    const payload: ChatRequest = { message, mode: 'general', session_id: sessionId };
     return this.http.post<ChatResponse>(`${this.baseUrl}/api/chat`, payload);
   }
 
-  chatPersonalized(message: string): Observable<ChatResponse> {
-    const payload: ChatRequest = { message, mode: 'personalized' };
+  chatPersonalized(message: string, sessionId?: string): Observable<ChatResponse> {
+    const payload: ChatRequest = { message, mode: 'personalized', session_id: sessionId };
     return this.http.post<ChatResponse>(`${this.baseUrl}/api/chat`, payload);
   }
 
+  clearSession(sessionId: string): Observable<any> {
+    return this.http.delete(`${this.baseUrl}/api/sessions/${sessionId}`);
+  }
+
   // File upload
   uploadFile(file: File): Observable<UploadResponse> {
     const formData = new FormData();
@@ -1,5 +1,6 @@
 import { Injectable } from '@angular/core';
 import { BehaviorSubject, Observable } from 'rxjs';
+import { ApiService } from './api.service';
 
 export interface ChatMessage {
   id: string;
@@ -19,7 +20,11 @@ export class ChatService {
   private isLoadingSubject = new BehaviorSubject<boolean>(false);
   public isLoading$ = this.isLoadingSubject.asObservable();
 
-  constructor() {}
+  // Server-side conversation sessions, one per mode so personalized history
+  // never leaks into general chat; assigned by the first chat response
+  private sessionIds: { [mode: string]: string } = {};
+
+  constructor(private apiService: ApiService) {}
 
   addMessage(message: ChatMessage): void {
     const currentMessages = this.messagesSubject.value;
@@ -56,6 +61,21 @@ export class ChatService {
 
   clearMessages(): void {
     this.messagesSubject.next([]);
+    // Drop the history on the server too instead of waiting for idle eviction
+    Object.values(this.sessionIds).forEach(sessionId => {
+      this.apiService.clearSession(sessionId).subscribe({
+        error: (error) => console.error('Error clearing session:', error)
+      });
+    });
+    this.sessionIds = {};
+  }
+
+  getSessionId(mode: 'general' | 'personalized'): string | undefined {
+    return this.sessionIds[mode];
+  }
+
+  setSessionId(mode: 'general' | 'personalized', sessionId: string): void {
+    this.sessionIds[mode] = sessionId;
   }
 
   getMessages(): ChatMessage[] {